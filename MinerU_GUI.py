@@ -1,75 +1,331 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import contextlib
+import functools
+import hashlib
+import io
+import mmap
 import os
+import queue
 import threading
-from magic_pdf.pipe.UNIPipe import UNIPipe
-from magic_pdf.pipe.OCRPipe import OCRPipe
-from magic_pdf.pipe.TXTPipe import TXTPipe
-from magic_pdf.data.data_reader_writer import FileBasedDataWriter
-from magic_pdf.config.make_content_config import DropMode, MakeMode
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import json
 from loguru import logger
 
 
+def _cuda_available():
+    """Return True if torch can see a CUDA device, without hard-requiring torch."""
+    try:
+        import torch
+
+        return torch.cuda.is_available()
+    except ImportError:
+        return False
+
+
+def _inference_context(use_gpu, half_precision):
+    """Context manager wrapping the compute-heavy pipe stages.
+
+    On CUDA with half precision enabled this autocasts model inference to
+    BF16 (FP16 on GPUs without BF16 support), roughly halving tensor
+    bandwidth; everywhere else it is a no-op.
+    """
+    if not (use_gpu and half_precision and _cuda_available()):
+        return contextlib.nullcontext()
+    import torch
+
+    dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    return torch.autocast("cuda", dtype=dtype)
+
+
+def _read_pdf_bytes(pdf_path):
+    """Map a PDF into memory instead of copying it onto the Python heap.
+
+    The hash/slice steps only need a buffer-protocol object, so an OS
+    page-cache backed mmap avoids an up-front heap copy; pdf_parse_main
+    converts to bytes just before the pipe, which requires real bytes. The
+    mmap keeps its own file handle, so the descriptor can be closed
+    immediately.
+    """
+    with open(pdf_path, "rb") as f:
+        pdf_bytes = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(pdf_bytes, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+        pdf_bytes.madvise(mmap.MADV_SEQUENTIAL)
+    return pdf_bytes
+
+
+def _content_hash(pdf_bytes):
+    """Short content digest used to key cached outputs on disk."""
+    try:
+        import xxhash
+
+        return xxhash.xxh3_64(pdf_bytes).hexdigest()[:8]
+    except ImportError:
+        return hashlib.blake2b(pdf_bytes, digest_size=4).hexdigest()
+
+
+def _slice_pdf_pages(pdf_bytes, start_page, end_page):
+    """Trim a PDF to the requested page range before it reaches the pipe.
+
+    Parsing 10 pages of a 200-page document should cost 10 pages, not 200.
+    Page numbers are 0-based and inclusive; if pypdf is not installed the
+    full document is parsed and the range is ignored with a warning.
+    """
+    try:
+        from pypdf import PdfReader, PdfWriter
+    except ImportError:
+        logger.warning("pypdf not installed; ignoring page range")
+        return pdf_bytes
+
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    start = start_page or 0
+    end = len(reader.pages) - 1 if end_page is None else min(end_page, len(reader.pages) - 1)
+    writer = PdfWriter()
+    for page in reader.pages[start : end + 1]:
+        writer.add_page(page)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+# Pipe stages reported through progress_callback: classify, analyze, parse, write
+_STAGES_PER_PDF = 4
+
+# Output writes run on a small pool so the compute thread never stalls on
+# disk; each worker process gets its own lazily created pool
+_io_pool = None
+_io_pool_lock = threading.Lock()
+_pending_writes = []
+
+
+def _submit_write(fn, *args):
+    """Queue an output write on the I/O pool and track its future."""
+    global _io_pool
+    with _io_pool_lock:
+        if _io_pool is None:
+            _io_pool = ThreadPoolExecutor(max_workers=2)
+        future = _io_pool.submit(fn, *args)
+        _pending_writes.append(future)
+    return future
+
+
+def _drain_writes():
+    """Block until every queued output write has finished, re-raising failures."""
+    while _pending_writes:
+        _pending_writes.pop().result()
+
+
+def _dump_json(path, obj):
+    """Stream JSON straight to disk through a large write buffer.
+
+    json.dump serializes incrementally, avoiding the full-document string
+    that json.dumps + write_string would materialize (and copy) in memory.
+    Written to a temp name and renamed into place so the cache-hit check
+    never mistakes a partial file for a finished one.
+    """
+    tmp_path = f"{path}.part"
+    with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        json.dump(obj, f, ensure_ascii=False, indent=4)
+    os.replace(tmp_path, path)
+
+
+def _dump_text(path, text):
+    """Write text output through a buffered handle, renamed into place."""
+    tmp_path = f"{path}.part"
+    with open(tmp_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+# Device the in-process model caches were built for; None until the first load
+_models_device = None
+
+
+def _set_model_device(use_gpu):
+    """Invalidate the model caches when the effective device changes.
+
+    magic_pdf's ModelSingleton keeps a class-level cache keyed by
+    (ocr, lang) that knows nothing about devices, so after a GPU-checkbox
+    toggle it would keep returning models instantiated for the previous
+    device no matter what MINERU_DEVICE says. Drop that cache and our own
+    memoization so the next load rebuilds on the newly selected device.
+    """
+    global _models_device
+    device = "cuda" if use_gpu else "cpu"
+    if _models_device == device:
+        return
+    if _models_device is not None:
+        try:
+            from magic_pdf.model.doc_analyze_by_custom_model import ModelSingleton
+
+            ModelSingleton._models = {}
+        except ImportError:
+            pass
+        _load_models.cache_clear()
+    _models_device = device
+
+
+@functools.lru_cache(maxsize=4)
+def _load_models(parse_method, lang=None, use_gpu=False):
+    """Load the magic_pdf model stack once per (method, lang, device) triple.
+
+    The layout/OCR weights run to hundreds of MB, so repeated "Process PDF"
+    clicks in one GUI session should not re-instantiate them. The device is
+    part of the cache key, and _set_model_device flushes this cache together
+    with ModelSingleton's when the GPU toggle changes, so a mid-session
+    switch rebuilds the stack on the newly selected device.
+    The models are resolved through magic_pdf's ModelSingleton and memoized
+    here; the "auto" method defers resolution until pipe_classify has decided
+    txt vs ocr.
+    """
+    try:
+        from magic_pdf.model.doc_analyze_by_custom_model import ModelSingleton
+    except ImportError:
+        logger.warning("magic_pdf model registry unavailable; skipping model warm-up")
+        return None
+
+    manager = ModelSingleton()
+    if parse_method in ("txt", "ocr"):
+        try:
+            manager.get_model(parse_method == "ocr", False, lang)
+        except TypeError:
+            # Older magic_pdf releases take no lang argument
+            manager.get_model(parse_method == "ocr", False)
+    return manager
+
+
+def _build_pipe(parse_method, pdf_bytes, image_writer):
+    """Construct the appropriate pipe for a document.
+
+    Kept at module level so the heavy model state loaded by magic_pdf on the
+    first construction stays warm in this process and is reused for every
+    subsequent document in a batch. The pipe imports pull in the whole ML
+    stack, so they stay inside this function to keep GUI startup instant.
+    """
+    if parse_method == "auto":
+        from magic_pdf.pipe.UNIPipe import UNIPipe
+
+        return UNIPipe(pdf_bytes, {"_pdf_type": "", "model_list": []}, image_writer)
+    elif parse_method == "txt":
+        from magic_pdf.pipe.TXTPipe import TXTPipe
+
+        return TXTPipe(pdf_bytes, [], image_writer)
+    elif parse_method == "ocr":
+        from magic_pdf.pipe.OCRPipe import OCRPipe
+
+        return OCRPipe(pdf_bytes, [], image_writer)
+    else:
+        raise ValueError("Invalid parse method")
+
+
 def pdf_parse_main(
     pdf_path,
     parse_method="auto",
     output_dir=None,
     is_json_md_dump=True,
     is_draw_visualization_bbox=True,
+    convert_markdown=True,
     lang=None,
     debug=False,
     start_page=None,
     end_page=None,
+    use_gpu=False,
+    half_precision=True,
+    pdf_bytes=None,
+    progress_callback=None,
+    async_writes=True,
 ):
     """Main PDF processing function"""
     try:
-        pdf_name = os.path.basename(pdf_path).split(".")[0]
+        from magic_pdf.data.data_reader_writer import FileBasedDataWriter
+
+        # Pin the device before any model is loaded; set it explicitly both
+        # ways so flipping the GPU checkbox mid-session takes effect
+        use_gpu = use_gpu and _cuda_available()
+        _set_model_device(use_gpu)
+        if use_gpu:
+            os.environ.setdefault("CUDA_VISIBLE_DEVICES", "0")
+            os.environ["MINERU_DEVICE"] = "cuda"
+        else:
+            os.environ["MINERU_DEVICE"] = "cpu"
+
+        if pdf_bytes is None:
+            pdf_bytes = _read_pdf_bytes(pdf_path)
+        if start_page is not None or end_page is not None:
+            pdf_bytes = _slice_pdf_pages(pdf_bytes, start_page, end_page)
+
+        # Key the output directory by content so re-processing an unchanged
+        # file (with the same page range) is a cache hit
+        pdf_name = (
+            f"{os.path.splitext(os.path.basename(pdf_path))[0]}"
+            f"_{_content_hash(pdf_bytes)}"
+        )
 
         if output_dir:
             output_path = os.path.join(output_dir, pdf_name)
         else:
             output_path = os.path.join(os.path.dirname(pdf_path), pdf_name)
 
+        if is_json_md_dump and os.path.exists(
+            os.path.join(output_path, f"{pdf_name}_content.json")
+        ):
+            md_exists = os.path.exists(os.path.join(output_path, f"{pdf_name}.md"))
+            if not convert_markdown or md_exists:
+                logger.info(f"Cached output found for {pdf_path}, skipping")
+                return True
+
         output_image_path = os.path.join(output_path, "images")
         os.makedirs(output_image_path, exist_ok=True)
 
         image_path_parent = os.path.basename(output_image_path)
-        pdf_bytes = open(pdf_path, "rb").read()
 
         image_writer = FileBasedDataWriter(output_image_path)
-        md_writer = FileBasedDataWriter(output_path)
-
-        # Initialize appropriate pipe based on method
-        if parse_method == "auto":
-            pipe = UNIPipe(pdf_bytes, {"_pdf_type": "", "model_list": []}, image_writer)
-        elif parse_method == "txt":
-            pipe = TXTPipe(pdf_bytes, [], image_writer)
-        elif parse_method == "ocr":
-            pipe = OCRPipe(pdf_bytes, [], image_writer)
-        else:
-            raise ValueError("Invalid parse method")
+
+        # fitz (inside the pipes) only accepts bytes/bytearray/BytesIO
+        # streams, so materialize the mmap before pipe construction
+        if isinstance(pdf_bytes, mmap.mmap):
+            pdf_bytes = bytes(pdf_bytes)
+
+        # Warm (or reuse) the model stack, then build the pipe around it
+        _load_models(parse_method, lang, use_gpu)
+        pipe = _build_pipe(parse_method, pdf_bytes, image_writer)
+
+        def report(stage):
+            if progress_callback:
+                progress_callback(stage)
 
         # Process the PDF
         pipe.pipe_classify()
-        pipe.pipe_analyze()
-        pipe.pipe_parse()
+        report("classify")
+        with _inference_context(use_gpu, half_precision):
+            pipe.pipe_analyze()
+            report("analyze")
+            pipe.pipe_parse()
+            report("parse")
 
         # Generate content
         content_list = pipe.pipe_mk_uni_format(image_path_parent, drop_mode="none")
 
-        # Save results
+        # Save results; async writes overlap the next document's compute, but
+        # only where the caller will drain the futures and see failures
+        write = _submit_write if async_writes else lambda fn, *args: fn(*args)
         if is_json_md_dump:
-            md_writer.write_string(
-                f"{pdf_name}_content.json",
-                json.dumps(content_list, ensure_ascii=False, indent=4),
+            write(
+                _dump_json,
+                os.path.join(output_path, f"{pdf_name}_content.json"),
+                content_list,
             )
 
-            # Generate and save markdown if requested
-            md_content = pipe.pipe_mk_markdown(image_path_parent, drop_mode="none")
-            if isinstance(md_content, list):
-                md_content = "\n".join(md_content)
-            md_writer.write_string(f"{pdf_name}.md", md_content)
+            # Generate and save markdown only if requested; the markdown pass
+            # re-walks the whole content tree and is worth skipping
+            if convert_markdown:
+                md_content = pipe.pipe_mk_markdown(image_path_parent, drop_mode="none")
+                if isinstance(md_content, list):
+                    md_content = "\n".join(md_content)
+                write(
+                    _dump_text, os.path.join(output_path, f"{pdf_name}.md"), md_content
+                )
+        report("write")
 
         return True
 
@@ -138,6 +394,7 @@ class MinerUGUI:
 
     def create_variables(self):
         self.input_path = tk.StringVar()
+        self.input_paths = []  # All PDFs selected for the current batch
         self.output_path = tk.StringVar()
         self.method = tk.StringVar(value="auto")
         self.lang = tk.StringVar()
@@ -149,6 +406,9 @@ class MinerUGUI:
         self.convert_markdown = tk.BooleanVar(
             value=True
         )  # New variable for markdown conversion
+        self.max_workers = tk.IntVar(value=min(os.cpu_count() or 1, 4))
+        self.use_gpu = tk.BooleanVar(value=False)
+        self.half_precision = tk.BooleanVar(value=True)
 
     def create_gui(self):
         # Main container
@@ -160,8 +420,8 @@ class MinerUGUI:
         input_frame.pack(fill=tk.X, pady=(0, 10))
         input_frame.columnconfigure(1, weight=1)
 
-        # Input PDF
-        ttk.Label(input_frame, text="Input PDF:").grid(
+        # Input PDFs
+        ttk.Label(input_frame, text="Input PDFs:").grid(
             row=0, column=0, sticky="w", pady=5
         )
         ttk.Entry(input_frame, textvariable=self.input_path).grid(
@@ -170,6 +430,9 @@ class MinerUGUI:
         ttk.Button(input_frame, text="Browse", command=self.browse_input).grid(
             row=0, column=2, padx=(5, 0)
         )
+        ttk.Button(input_frame, text="Folder", command=self.browse_input_folder).grid(
+            row=0, column=3, padx=(5, 0)
+        )
 
         # Output Directory
         ttk.Label(input_frame, text="Output Directory:").grid(
@@ -218,11 +481,36 @@ class MinerUGUI:
         )
         ttk.Checkbutton(
             checkbox_frame, text="Convert to Markdown", variable=self.convert_markdown
-        ).pack(side=tk.LEFT)
+        ).pack(side=tk.LEFT, padx=(0, 10))
+        self.gpu_checkbox = ttk.Checkbutton(
+            checkbox_frame, text="Use GPU", variable=self.use_gpu
+        )
+        self.gpu_checkbox.pack(side=tk.LEFT, padx=(0, 10))
+        self.half_checkbox = ttk.Checkbutton(
+            checkbox_frame, text="Half Precision", variable=self.half_precision
+        )
+        self.half_checkbox.pack(side=tk.LEFT)
+        # Probe CUDA off the GUI thread: _cuda_available imports torch, which
+        # would otherwise delay the window by seconds
+        self.gpu_checkbox.state(["disabled"])
+        self.half_checkbox.state(["disabled"])
+        threading.Thread(target=self._probe_cuda, daemon=True).start()
+
+        # Parallel workers for batch processing
+        ttk.Label(options_frame, text="Max Workers:").grid(
+            row=3, column=0, sticky="w", pady=5
+        )
+        ttk.Spinbox(
+            options_frame,
+            textvariable=self.max_workers,
+            from_=1,
+            to=os.cpu_count() or 1,
+            width=5,
+        ).grid(row=3, column=1, sticky="w", padx=5)
 
         # Page range
         page_frame = ttk.Frame(options_frame)
-        page_frame.grid(row=3, column=0, columnspan=2, sticky="w", pady=5)
+        page_frame.grid(row=4, column=0, columnspan=2, sticky="w", pady=5)
 
         ttk.Label(page_frame, text="Page Range (optional):").pack(side=tk.LEFT)
         ttk.Entry(page_frame, textvariable=self.start_page, width=5).pack(
@@ -248,89 +536,219 @@ class MinerUGUI:
         status_frame = ttk.Frame(main_frame)
         status_frame.pack(fill=tk.X, side=tk.BOTTOM)
 
-        self.progress = ttk.Progressbar(status_frame, mode="indeterminate")
+        self.progress = ttk.Progressbar(status_frame, mode="determinate", maximum=100)
         self.progress.pack(fill=tk.X, pady=5)
 
         ttk.Label(status_frame, textvariable=self.status).pack(side=tk.LEFT)
 
+    def _probe_cuda(self):
+        if _cuda_available():
+            self.root.after(0, self.gpu_checkbox.state, ["!disabled"])
+            self.root.after(0, self.half_checkbox.state, ["!disabled"])
+
     def process_pdf(self):
         if not self.validate_inputs():
             return
 
+        # Read each Tk variable once on the GUI thread before handing off
+        pdf_paths = self.get_input_paths()
+        start_text = self.start_page.get()
+        end_text = self.end_page.get()
+        start_page = int(start_text) if start_text else None
+        end_page = int(end_text) if end_text else None
+        max_workers = max(1, self.max_workers.get())
+        lang = self.lang.get()
+        parse_kwargs = dict(
+            parse_method=self.method.get(),
+            output_dir=self.output_path.get(),
+            is_json_md_dump=True,
+            is_draw_visualization_bbox=True,
+            convert_markdown=self.convert_markdown.get(),
+            lang=lang if lang else None,
+            debug=self.debug.get(),
+            start_page=start_page,
+            end_page=end_page,
+            use_gpu=self.use_gpu.get(),
+            half_precision=self.half_precision.get(),
+        )
+
+        def set_status(message):
+            # Tk isn't thread-safe; marshal updates back to the GUI thread
+            self.root.after(0, self.status.set, message)
+
+        total_stages = len(pdf_paths) * _STAGES_PER_PDF
+        completed = {"stages": 0}
+
+        def show_progress(stages_done):
+            completed["stages"] = stages_done
+            self.root.after(0, self.progress.configure, {"value": stages_done})
+
+        def advance_stage(_stage):
+            show_progress(completed["stages"] + 1)
+
         def process():
             try:
-                self.status.set("Processing PDF...")
-                self.progress.start()
-
-                # Convert page numbers if provided
-                start_page = (
-                    int(self.start_page.get()) if self.start_page.get() else None
-                )
-                end_page = int(self.end_page.get()) if self.end_page.get() else None
-
-                pdf_parse_main(
-                    pdf_path=self.input_path.get(),
-                    parse_method=self.method.get(),
-                    output_dir=self.output_path.get(),
-                    is_json_md_dump=True,
-                    is_draw_visualization_bbox=True,
-                    lang=self.lang.get() if self.lang.get() else None,
-                    debug=self.debug.get(),
-                    start_page=start_page,
-                    end_page=end_page,
+                self.root.after(
+                    0,
+                    self.progress.configure,
+                    {"mode": "determinate", "maximum": total_stages, "value": 0},
                 )
 
-                self.status.set("Processing complete!")
-                messagebox.showinfo("Success", "PDF processing completed successfully!")
+                if max_workers > 1 and len(pdf_paths) > 1:
+                    # Stage callbacks can't cross the process boundary, so
+                    # advance one whole file's worth per completed future.
+                    # Workers write synchronously: their _pending_writes can't
+                    # be drained from here, and async writes buy nothing when
+                    # the pool already provides the overlap
+                    done = 0
+                    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                        futures = {
+                            pool.submit(
+                                pdf_parse_main,
+                                pdf_path=path,
+                                async_writes=False,
+                                **parse_kwargs,
+                            ): path
+                            for path in pdf_paths
+                        }
+                        for future in as_completed(futures):
+                            future.result()
+                            done += 1
+                            show_progress(done * _STAGES_PER_PDF)
+                            set_status(
+                                f"Processed {done}/{len(pdf_paths)}: "
+                                f"{os.path.basename(futures[future])}"
+                            )
+                else:
+                    # Prefetch the next file's bytes while the current one is
+                    # in the compute-bound pipe, hiding read latency
+                    prefetch = queue.Queue(maxsize=2)
+
+                    def produce():
+                        for path in pdf_paths:
+                            try:
+                                # bytes() faults the pages in on this thread,
+                                # so the disk read really overlaps compute and
+                                # the consumer skips its own bytes() copy
+                                prefetch.put((path, bytes(_read_pdf_bytes(path))))
+                            except Exception as exc:
+                                # Hand the failure to the consumer; a silent
+                                # death here would block get() forever
+                                prefetch.put((path, exc))
+                                return
+
+                    threading.Thread(target=produce, daemon=True).start()
+                    for index in range(1, len(pdf_paths) + 1):
+                        pdf_path, pdf_bytes = prefetch.get()
+                        if isinstance(pdf_bytes, Exception):
+                            raise pdf_bytes
+                        set_status(
+                            f"Processing PDF {index}/{len(pdf_paths)}: "
+                            f"{os.path.basename(pdf_path)}"
+                        )
+                        pdf_parse_main(
+                            pdf_path=pdf_path,
+                            pdf_bytes=pdf_bytes,
+                            progress_callback=advance_stage,
+                            **parse_kwargs,
+                        )
+                        # Snap to a file boundary in case stages were skipped
+                        # (e.g. a cache hit)
+                        show_progress(index * _STAGES_PER_PDF)
+
+                # Join any writes still in flight before declaring success
+                _drain_writes()
+                set_status("Processing complete!")
+                self.root.after(
+                    0,
+                    messagebox.showinfo,
+                    "Success",
+                    f"Processed {len(pdf_paths)} PDF(s) successfully!",
+                )
             except Exception as e:
-                self.status.set("Error occurred!")
-                messagebox.showerror("Error", str(e))
+                set_status("Error occurred!")
+                self.root.after(0, messagebox.showerror, "Error", str(e))
                 logger.exception("Error processing PDF")
             finally:
-                self.progress.stop()
+                # Never let queued writes outlive the run that submitted
+                # them, or a stale failure would surface in the next batch
+                try:
+                    _drain_writes()
+                except Exception as e:
+                    set_status("Error occurred!")
+                    self.root.after(0, messagebox.showerror, "Error", str(e))
+                    logger.exception("Error flushing output writes")
                 self.processing = False
 
         if not self.processing:
             self.processing = True
             threading.Thread(target=process, daemon=True).start()
 
+    def get_input_paths(self):
+        # Prefer the browsed selection, but honor paths typed into the entry
+        if self.input_paths and self.input_path.get() == "; ".join(self.input_paths):
+            return self.input_paths
+        return [p.strip() for p in self.input_path.get().split(";") if p.strip()]
+
     def validate_inputs(self):
-        if not self.input_path.get():
-            messagebox.showerror("Error", "Please select an input PDF file.")
+        # Read each Tk variable once; every .get() round-trips through Tcl
+        if not self.get_input_paths():
+            messagebox.showerror("Error", "Please select at least one input PDF file.")
             return False
         if not self.output_path.get():
             messagebox.showerror("Error", "Please select an output directory.")
             return False
 
+        try:
+            if self.max_workers.get() < 1:
+                raise ValueError
+        except (tk.TclError, ValueError):
+            messagebox.showerror("Error", "Max workers must be a positive integer.")
+            return False
+
         # Validate page range if provided
-        if self.start_page.get() or self.end_page.get():
+        start_text = self.start_page.get()
+        end_text = self.end_page.get()
+        if start_text or end_text:
             try:
-                if self.start_page.get():
-                    start = int(self.start_page.get())
-                    if start < 0:
-                        raise ValueError
-                if self.end_page.get():
-                    end = int(self.end_page.get())
-                    if end < 0:
-                        raise ValueError
-                if self.start_page.get() and self.end_page.get():
-                    if start > end:
-                        messagebox.showerror(
-                            "Error", "End page must be greater than start page."
-                        )
-                        return False
+                start = int(start_text) if start_text else None
+                end = int(end_text) if end_text else None
+                if (start is not None and start < 0) or (end is not None and end < 0):
+                    raise ValueError
             except ValueError:
                 messagebox.showerror("Error", "Page numbers must be positive integers.")
                 return False
+            if start is not None and end is not None and start > end:
+                messagebox.showerror(
+                    "Error", "End page must be greater than start page."
+                )
+                return False
 
         return True
 
     def browse_input(self):
-        path = filedialog.askopenfilename(filetypes=[("PDF files", "*.pdf")])
-        if path:
-            self.input_path.set(path)
-            if not self.output_path.get():
-                self.output_path.set(os.path.dirname(path))
+        paths = filedialog.askopenfilenames(filetypes=[("PDF files", "*.pdf")])
+        if paths:
+            self.set_input_paths(list(paths))
+
+    def browse_input_folder(self):
+        folder = filedialog.askdirectory()
+        if folder:
+            paths = sorted(
+                os.path.join(folder, name)
+                for name in os.listdir(folder)
+                if name.lower().endswith(".pdf")
+            )
+            if not paths:
+                messagebox.showerror("Error", "No PDF files found in that folder.")
+                return
+            self.set_input_paths(paths)
+
+    def set_input_paths(self, paths):
+        self.input_paths = paths
+        self.input_path.set("; ".join(paths))
+        if not self.output_path.get():
+            self.output_path.set(os.path.dirname(paths[0]))
 
     def browse_output(self):
         path = filedialog.askdirectory()
@@ -338,13 +756,15 @@ class MinerUGUI:
             self.output_path.set(path)
 
     def on_closing(self):
-        if self.processing:
-            if messagebox.askokcancel(
-                "Quit", "Processing is in progress. Do you want to quit anyway?"
-            ):
-                self.root.destroy()
-        else:
-            self.root.destroy()
+        if self.processing and not messagebox.askokcancel(
+            "Quit", "Processing is in progress. Do you want to quit anyway?"
+        ):
+            return
+        try:
+            _drain_writes()
+        except Exception:
+            logger.exception("Error flushing output writes")
+        self.root.destroy()
 
     def run(self):
         self.root.mainloop()